@@ -1,4 +1,4 @@
-from qiskit import QuantumCircuit, Aer, execute
+from qiskit import QuantumCircuit
 from qiskit_aer import AerSimulator
 import numpy as np
 import time
@@ -20,24 +20,15 @@ def qrng(num_bits: int) -> str:
     # print(f"Number of circuits: {num_circuits}")
 
     simulator = AerSimulator()
-    binary_str = ""
 
     start_time = time.time()
-    for _ in range(num_circuits):
-        if _ % 100 == 0:
-            print(f"time taken for {_}: {time.time() - start_time}")
-        if _ % 1000 == 0:
-            print(f"time taken for {_}: {time.time() - start_time}")
-        qc = QuantumCircuit(qubits_per_circuit, qubits_per_circuit)
-        qc.h(range(qubits_per_circuit))
-        qc.measure(range(qubits_per_circuit), range(qubits_per_circuit))
+    qc = QuantumCircuit(qubits_per_circuit, qubits_per_circuit)
+    qc.h(range(qubits_per_circuit))
+    qc.measure(range(qubits_per_circuit), range(qubits_per_circuit))
 
-        # print(qc)
-
-        result = execute(qc, simulator, shots=1).result()
-        counts = result.get_counts(qc)
-
-        binary_str += "".join([str(int(key)) for key in counts.keys()])
+    # every shot of the same circuit yields an independent block of random bits
+    result = simulator.run(qc, shots=num_circuits, memory=True).result()
+    binary_str = "".join(result.get_memory(qc))
 
     print(f"Time taken: {time.time() - start_time}")
     if len(binary_str) < num_bits:
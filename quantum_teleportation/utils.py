@@ -6,6 +6,7 @@ import logging
 import colorlog
 from datetime import datetime
 import brotli
+import numpy as np
 
 
 def text_from_file(file_path: str) -> str:
@@ -73,21 +74,26 @@ def convert_text_to_binary_with_filter(text: str) -> tuple[str, str]:
 
 def convert_binary_to_text(binary_list) -> str:
     """
-    Converts an array of binary strings to text.
+    Converts an array of binary strings, or already packed bytes, to text.
 
     Args:
-        binary_list (List[str]): List of binary strings.
+        binary_list (List[str] | bytes): List of binary strings or packed bytes.
 
     Returns:
         str: Text representation of the binary input.
     """
     try:
-        text = bytearray(int(binary, 2) for binary in binary_list).decode("utf-8")
+        if not isinstance(binary_list, (bytes, bytearray)):
+            binary_list = bytearray(int(binary, 2) for binary in binary_list)
+        text = binary_list.decode("utf-8")
         return text
     except Exception as e:
         raise Exception(f"Error converting binary to text: {e} | Perhaps the key is incorrect? Eve is eveing")
 
 
+_FLIP_TABLE = str.maketrans("01", "10")
+
+
 def bit_flipper(bits: str) -> str:
     """
     Flips bits in the input.
@@ -98,7 +104,7 @@ def bit_flipper(bits: str) -> str:
     Returns:
         str: Flipped bit string.
     """
-    return "".join(["1" if x == "0" else "0" for x in bits])
+    return bits.translate(_FLIP_TABLE)
 
 
 def convert_time(time_seconds):
@@ -245,7 +251,6 @@ def image_to_base64(image_path: str) -> str:
     """
     with open(image_path, "rb") as image_file:
         encoded_image = base64.b64encode(image_file.read()).decode("utf-8")
-    print(f"Encoded image: {encoded_image}")
     return encoded_image
 
 
@@ -268,22 +273,16 @@ def base64_to_image(base64_string, output_path):
     return output_path
 
 
-def handle_flipped_results(flipped_results: list[str], logs: bool = False) -> list[str]:
-    """Handles flipped results by merging and splitting binary chunks into bytes.
+def handle_flipped_results(flipped_results: list[str]) -> bytes:
+    """Handles flipped results by merging and packing the bits into bytes.
     Args:
         flipped_results (list): List of flipped results.
     Returns:
-        list: List of bytes (8-bit chunks).
+        bytes: The packed bytes; a trailing partial byte is padded with zeros.
     """
     merged_binary = "".join(flipped_results)
-    bytes_list = []
-    for i in range(0, len(merged_binary), 8):
-        byte = merged_binary[i : i + 8]
-        bytes_list.append(byte)
-    if logs:
-        print(f"Merged binary: {merged_binary}")
-        print(f"Bytes list: {bytes_list}")
-    return bytes_list
+    bits = np.frombuffer(merged_binary.encode("ascii"), dtype=np.uint8) - ord("0")
+    return np.packbits(bits).tobytes()
 
 
 def save_data(converted_chunks, output_path, image_path=None, data=None):